@@ -66,9 +66,9 @@ async def run_cli(args: argparse.Namespace) -> int:
         port_cfg,
         args.duration,
     )
-    start = time.time()
+    start = time.monotonic()
     try:
-        while time.time() - start < args.duration:
+        while time.monotonic() - start < args.duration:
             await asyncio.sleep(0.5)
     finally:
         snapshot = session.snapshot()
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import math
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Deque, List
 
+import numpy as np
+
 from .utils import RollingStats
 
 
@@ -105,11 +106,17 @@ class LoopAnalyzer:
 
 
 class ImuAnalyzer:
-    def __init__(self, window: float = 30.0) -> None:
+    def __init__(self, window: float = 30.0, capacity: int = 1024) -> None:
         self.window = window
-        self.samples: Deque[
-            tuple[float, tuple[int, int, int], tuple[int, int, int]]
-        ] = deque()
+        # Preallocated (ts, gx, gy, gz, ax, ay, az) rows; the live window is
+        # _buf[_head:_tail], so snapshots reduce over a view without copying.
+        self._buf = np.empty((capacity, 7), dtype=np.float64)
+        self._head = 0
+        self._tail = 0
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._buf[self._head : self._tail]
 
     def add_sample(
         self,
@@ -119,30 +126,47 @@ class ImuAnalyzer:
     ) -> None:
         if ts is None:
             ts = time.time()
-        self.samples.append((ts, gyro, acc))
+        if self._tail == len(self._buf):
+            self._compact()
+        self._buf[self._tail] = (ts, *gyro, *acc)
+        self._tail += 1
         self._evict(ts)
 
+    def _compact(self) -> None:
+        live = self._tail - self._head
+        buf = self._buf
+        if live * 2 > len(buf):
+            buf = np.empty((len(buf) * 2, 7), dtype=np.float64)
+        buf[:live] = self._buf[self._head : self._tail]
+        self._buf = buf
+        self._head = 0
+        self._tail = live
+
     def _evict(self, now: float) -> None:
-        while self.samples and now - self.samples[0][0] > self.window:
-            self.samples.popleft()
+        stamps = self._buf[self._head : self._tail, 0]
+        self._head += int(np.searchsorted(stamps, now - self.window, side="left"))
 
     def snapshot(self, gyro_scale: float = 1.0) -> ImuStatistics | None:
-        if not self.samples:
+        if self._tail == self._head:
             return None
-        gyro_values = list(zip(*(sample[1] for sample in self.samples)))
-        acc_values = list(zip(*(sample[2] for sample in self.samples)))
-        gyro_std = [statistics_std(axis) * gyro_scale for axis in gyro_values]
-        gyro_bias = [statistics_mean(axis) * gyro_scale for axis in gyro_values]
-        acc_norms = [vector_norm(acc) for acc in zip(*acc_values)]
-        acc_norm_std = statistics_std(tuple(acc_norms))
+        window = self.samples
+        gyro_bias, gyro_std, acc_norm_std = _imu_window_stats(window)
         return ImuStatistics(
-            samples=len(self.samples),
-            gyro_std=gyro_std,
-            gyro_bias=gyro_bias,
-            acc_norm_std=acc_norm_std,
+            samples=len(window),
+            gyro_std=(gyro_std * gyro_scale).tolist(),
+            gyro_bias=(gyro_bias * gyro_scale).tolist(),
+            acc_norm_std=float(acc_norm_std),
         )
 
 
+def _imu_window_stats(
+    window: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    gyro = window[:, 1:4]
+    acc_norm = np.sqrt(np.square(window[:, 4:7]).sum(axis=1))
+    return gyro.mean(axis=0), gyro.std(axis=0), float(acc_norm.std())
+
+
 def evaluate(
     profile: str,
     loop_stats: LoopStatistics | None,
@@ -164,13 +188,13 @@ def evaluate(
             ok = False
             reasons.append(f"loop_jitter {jitter:.2f}>{limit:.2f}")
     if imu_stats:
+        limit = profile_cfg["max_gyro_std"]
         for axis, std_val in zip("xyz", imu_stats.gyro_std):
-            limit = profile_cfg["max_gyro_std"]
             if std_val > limit:
                 ok = False
                 reasons.append(f"gyro_std_{axis} {std_val:.2f}>{limit:.2f}")
+        limit = profile_cfg["max_gyro_bias"]
         for axis, bias_val in zip("xyz", imu_stats.gyro_bias):
-            limit = profile_cfg["max_gyro_bias"]
             if abs(bias_val) > limit:
                 ok = False
                 reasons.append(f"gyro_bias_{axis} {bias_val:.2f}>{limit:.2f}")
@@ -183,17 +207,19 @@ def evaluate(
         ok = False
         reasons.append(f"i2c_err {i2c_error_rate:.2f}>{limit_i2c:.2f}")
     if analog:
-        if "vbat_V" in analog:
+        vbat = analog.get("vbat_V")
+        if vbat is not None:
             limit_vbat = profile_cfg["min_vbat"]
-            if analog["vbat_V"] < limit_vbat:
+            if vbat < limit_vbat:
                 ok = False
-                reasons.append(f"vbat_low {analog['vbat_V']:.2f}<{limit_vbat:.2f}")
-        if "amps_A" in analog:
+                reasons.append(f"vbat_low {vbat:.2f}<{limit_vbat:.2f}")
+        amps = analog.get("amps_A")
+        if amps is not None:
             limit_amps = profile_cfg["max_amps"]
-            if analog["amps_A"] > limit_amps:
+            if amps > limit_amps:
                 ok = False
-                reasons.append(f"amps_high {analog['amps_A']:.2f}>{limit_amps:.2f}")
-    if not profile_cfg.get("ignore_tilt", False) and attitude:
+                reasons.append(f"amps_high {amps:.2f}>{limit_amps:.2f}")
+    if not profile_cfg["ignore_tilt"] and attitude:
         roll = abs(attitude.get("roll_deg", 0.0))
         pitch = abs(attitude.get("pitch_deg", 0.0))
         tilt = max(roll, pitch)
@@ -204,22 +230,3 @@ def evaluate(
     analytics.ok = ok
     analytics.reasons = reasons
     return analytics
-
-
-def statistics_std(values: tuple[int, ...] | tuple[float, ...]) -> float:
-    n = len(values)
-    if n == 0:
-        return 0.0
-    mean = sum(values) / n
-    variance = sum((v - mean) ** 2 for v in values) / n
-    return math.sqrt(variance)
-
-
-def statistics_mean(values: tuple[int, ...] | tuple[float, ...]) -> float:
-    if not values:
-        return 0.0
-    return sum(values) / len(values)
-
-
-def vector_norm(vector: tuple[int, ...] | tuple[float, ...]) -> float:
-    return math.sqrt(sum(v * v for v in vector))
@@ -13,12 +13,49 @@ def _split(payload: bytes) -> Tuple[int, bytes]:
     return count, payload[1:]
 
 
+# meter_type -> (unit label, scaled key, divisor), resolved once per payload.
+_METER_SCALES: Dict[str, Tuple[str, str | None, float]] = {
+    "voltage": ("V(0.1)", "voltage_V", 10.0),
+    "current": ("A(0.01)", "amps_A", 100.0),
+}
+_UNSCALED = ("A(0.01)", None, 1.0)
+# A trailing 2/4 byte remainder is a bare value without an id byte.
+_TAIL_VALUE = {2: struct.Struct("<H"), 4: struct.Struct("<I")}
+# Well-formed payloads are `count` (id: u8, value: u16) pairs; one Struct per
+# count decodes all of them in a single call.
+_ENTRY_SIZE = 3
+_ENTRY_STRUCTS: Dict[int, struct.Struct] = {}
+
+
+def _entries_struct(count: int) -> struct.Struct:
+    fmt = _ENTRY_STRUCTS.get(count)
+    if fmt is None:
+        fmt = _ENTRY_STRUCTS[count] = struct.Struct("<" + "BH" * count)
+    return fmt
+
+
 def parse_meter_payload(
     payload: bytes, meter_type: str
-) -> Tuple[Dict[str, Any], str, bool]:
-    raw = payload.hex()
+) -> Tuple[Dict[str, Any], bytes, bool]:
     if not payload:
-        return ({"meters": [], "count_declared": 0, "invalid": False}, raw, False)
+        return ({"meters": [], "count_declared": 0, "invalid": False}, payload, False)
+    unit, key, divisor = _METER_SCALES.get(meter_type, _UNSCALED)
+    count = payload[0]
+    if count and len(payload) == 1 + count * _ENTRY_SIZE:
+        flat = _entries_struct(count).unpack_from(payload, 1)
+        pairs = zip(flat[::2], flat[1::2])
+        if key is None:
+            meters = [{"id": i, "value_raw": v, "unit": unit} for i, v in pairs]
+        else:
+            meters = [
+                {"id": i, "value_raw": v, "unit": unit, key: v / divisor}
+                for i, v in pairs
+            ]
+        return (
+            {"invalid": False, "count_declared": count, "meters": meters},
+            payload,
+            False,
+        )
     count, rest = _split(payload)
     entries: List[Dict[str, Any]] = []
     invalid = False
@@ -26,12 +63,12 @@ def parse_meter_payload(
     while cursor < len(rest):
         remaining = len(rest) - cursor
         if remaining in (2, 4):
-            values = struct.unpack_from("<" + {2: "H", 4: "I"}[remaining], rest, cursor)
+            (value_raw,) = _TAIL_VALUE[remaining].unpack_from(rest, cursor)
             invalid = True
             entries.append(
                 {
                     "id": len(entries),
-                    "value_raw": values[0],
+                    "value_raw": value_raw,
                     "unit": "auto",
                 }
             )
@@ -47,12 +84,10 @@ def parse_meter_payload(
             entry: Dict[str, Any] = {
                 "id": meter_id,
                 "value_raw": value,
-                "unit": "V(0.1)" if meter_type == "voltage" else "A(0.01)",
+                "unit": unit,
             }
-            if meter_type == "voltage":
-                entry["voltage_V"] = value / 10.0
-            elif meter_type == "current":
-                entry["amps_A"] = value / 100.0
+            if key is not None:
+                entry[key] = value / divisor
             entries.append(entry)
         else:
             invalid = True
@@ -64,4 +99,4 @@ def parse_meter_payload(
         "count_declared": count,
         "meters": entries,
     }
-    return data, raw, invalid
+    return data, payload, invalid
@@ -5,7 +5,8 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional, Protocol
+from functools import lru_cache
+from typing import Dict, Optional, Protocol, Sequence
 
 import serial
 
@@ -14,6 +15,9 @@ log = logging.getLogger(__name__)
 MSP_HEADER = b"$M"
 DIR_TO_FC = ord("<")
 DIR_FROM_FC = ord(">")
+_REQUEST_PREAMBLE = MSP_HEADER + bytes((DIR_TO_FC,))
+_RESPONSE_PREAMBLE = MSP_HEADER + bytes((DIR_FROM_FC,))
+_HEADER_LEN = len(_RESPONSE_PREAMBLE) + 2
 
 
 class SerialLike(Protocol):
@@ -44,31 +48,71 @@ class MSPFrame:
         }
 
 
+_XOR_FOLD_MIN = 64
+
+
+def _xor_checksum(data: bytes, seed: int = 0) -> int:
+    """XOR all bytes of *data* into *seed*.
+
+    Long buffers are read as one little-endian integer and folded in half
+    until a single byte is left, so the work is log2(len) big-int operations
+    instead of one interpreter iteration per byte. Below
+    ``_XOR_FOLD_MIN`` bytes the plain loop is cheaper than the big-int setup.
+    """
+
+    if len(data) < _XOR_FOLD_MIN:
+        for byte in data:
+            seed ^= byte
+        return seed
+    return _xor_fold(data, seed)
+
+
+def _xor_fold(data: bytes, seed: int) -> int:
+    value = int.from_bytes(data, "little")
+    width = 8 << (len(data) - 1).bit_length()
+    while width > 8:
+        width >>= 1
+        value = (value >> width) ^ (value & ((1 << width) - 1))
+    return value ^ seed
+
+
 def build_frame_v1(cmd: int, payload: bytes = b"") -> bytes:
+    if not payload:
+        return _empty_frame_v1(cmd)
     if not (0 <= cmd < 256):
         raise ValueError("command must fit in a single byte")
-    if len(payload) > 255:
+    size = len(payload)
+    if size > 255:
         raise ValueError("payload too large for MSP v1")
-    checksum = 0
-    frame = bytearray()
-    frame.extend(MSP_HEADER)
-    frame.append(DIR_TO_FC)
-    frame.append(len(payload))
-    frame.append(cmd)
-    checksum ^= len(payload)
-    checksum ^= cmd
-    for b in payload:
-        checksum ^= b
-    frame.extend(payload)
-    frame.append(checksum)
-    return bytes(frame)
+    # join() sizes the frame once; cheaper than growing a bytearray.
+    checksum = _xor_checksum(payload, size ^ cmd)
+    return b"".join(
+        (_REQUEST_PREAMBLE, bytes((size, cmd)), payload, bytes((checksum,)))
+    )
+
+
+@lru_cache(maxsize=256)
+def _empty_frame_v1(cmd: int) -> bytes:
+    # Parameterless requests (every poll command) never change.
+    if not (0 <= cmd < 256):
+        raise ValueError("command must fit in a single byte")
+    return _REQUEST_PREAMBLE + bytes((0, cmd, cmd))
+
+
+@lru_cache(maxsize=64)
+def _request_burst(cmds: tuple[int, ...]) -> bytes:
+    # The poll and probe command sets are fixed, so their concatenated
+    # request frames are resolved once and written as-is afterwards.
+    return b"".join(build_frame_v1(cmd) for cmd in cmds)
 
 
 def _read_exact(ser: SerialLike, size: int, timeout: float) -> bytes:
-    deadline = time.time() + timeout
+    now = time.monotonic
+    read = ser.read
+    deadline = now() + timeout
     chunks = bytearray()
-    while len(chunks) < size and time.time() < deadline:
-        chunk = ser.read(size - len(chunks))
+    while len(chunks) < size and now() < deadline:
+        chunk = read(size - len(chunks))
         if chunk:
             chunks.extend(chunk)
         else:
@@ -79,42 +123,42 @@ def _read_exact(ser: SerialLike, size: int, timeout: float) -> bytes:
 def read_response_v1(
     ser: SerialLike, expect_cmd: Optional[int], timeout: float
 ) -> tuple[Optional[int], bytes, Optional[str]]:
-    deadline = time.time() + timeout
-    buffer = bytearray()
-    while time.time() < deadline:
-        chunk = ser.read(1)
+    # Two reads per frame in the common case: the 5 byte header
+    # ("$M>" + size + cmd), then payload + checksum. Line noise is skipped by
+    # dropping bytes until the buffer is a prefix of the response preamble;
+    # nothing past the current frame is ever requested, so back-to-back
+    # replies stay intact for the next call.
+    now = time.monotonic
+    read = ser.read
+    deadline = now() + timeout
+    header = bytearray()
+    while len(header) < _HEADER_LEN:
+        if now() >= deadline:
+            if len(header) == 3:
+                return None, b"", "timeout waiting length"
+            if len(header) == 4:
+                return None, b"", "timeout waiting command"
+            return None, b"", "timeout"
+        chunk = read(_HEADER_LEN - len(header))
         if not chunk:
             time.sleep(0.001)
             continue
-        buffer.extend(chunk)
-        if len(buffer) >= 3 and buffer[-3:-1] == MSP_HEADER:
-            direction = buffer[-1]
-            if direction != DIR_FROM_FC:
-                continue
-            length_bytes = _read_exact(ser, 1, timeout)
-            if len(length_bytes) != 1:
-                return None, b"", "timeout waiting length"
-            payload_len = length_bytes[0]
-            cmd_bytes = _read_exact(ser, 1, timeout)
-            if len(cmd_bytes) != 1:
-                return None, b"", "timeout waiting command"
-            cmd = cmd_bytes[0]
-            payload = _read_exact(ser, payload_len, timeout)
-            if len(payload) != payload_len:
-                return None, payload, "timeout waiting payload"
-            checksum_bytes = _read_exact(ser, 1, timeout)
-            if len(checksum_bytes) != 1:
-                return None, payload, "timeout waiting checksum"
-            checksum = checksum_bytes[0]
-            computed = payload_len ^ cmd
-            for b in payload:
-                computed ^= b
-            if checksum != computed:
-                return cmd, payload, "checksum"
-            if expect_cmd is not None and cmd != expect_cmd:
-                return cmd, payload, "unexpected_cmd"
-            return cmd, payload, None
-    return None, b"", "timeout"
+        header.extend(chunk)
+        while header and not _RESPONSE_PREAMBLE.startswith(header[:3]):
+            del header[0]
+    payload_len = header[3]
+    cmd = header[4]
+    body = _read_exact(ser, payload_len + 1, timeout)
+    if len(body) < payload_len:
+        return None, body, "timeout waiting payload"
+    payload = body[:payload_len]
+    if len(body) == payload_len:
+        return None, payload, "timeout waiting checksum"
+    if body[payload_len] != _xor_checksum(payload, payload_len ^ cmd):
+        return cmd, payload, "checksum"
+    if expect_cmd is not None and cmd != expect_cmd:
+        return cmd, payload, "unexpected_cmd"
+    return cmd, payload, None
 
 
 def open_serial_port(
@@ -148,3 +192,51 @@ def send_command(
         )
         time.sleep(0.02 * attempt)
     return None, b"", error or "timeout"
+
+
+def send_commands(
+    ser: serial.Serial,
+    cmds: Sequence[int],
+    timeout: float = 0.3,
+    retries: int = 3,
+) -> Dict[int, tuple[Optional[int], bytes, Optional[str]]]:
+    """Send parameterless *cmds* in one burst and collect replies by command.
+
+    All request frames go out in a single write and the replies are
+    demultiplexed by command id, so a poll costs one round-trip instead of
+    one per command. Commands whose reply is missing or corrupted are
+    re-sent together in the next burst, up to *retries* bursts in total.
+
+    Input left over from an earlier burst is discarded before each write,
+    and replies are drained against a *timeout* deadline rather than a read
+    count, so a late or unrelated frame never takes the place of a pending
+    command's reply.
+    """
+
+    now = time.monotonic
+    results: Dict[int, tuple[Optional[int], bytes, Optional[str]]] = {}
+    errors: Dict[int, str] = {}
+    pending = list(dict.fromkeys(cmds))
+    for attempt in range(1, retries + 1):
+        ser.reset_input_buffer()
+        ser.write(_request_burst(tuple(pending)))
+        ser.flush()
+        deadline = now() + timeout
+        while pending and (remaining := deadline - now()) > 0:
+            cmd_resp, payload, error = read_response_v1(ser, None, remaining)
+            if cmd_resp is None:
+                break
+            if cmd_resp not in pending:
+                continue
+            if error is None:
+                pending.remove(cmd_resp)
+                results[cmd_resp] = (cmd_resp, payload, None)
+            else:
+                errors[cmd_resp] = error
+        if not pending:
+            break
+        log.debug("MSP burst attempt %s/%s missing %s", attempt, retries, pending)
+        time.sleep(0.02 * attempt)
+    for cmd in pending:
+        results[cmd] = (None, b"", errors.get(cmd, "timeout"))
+    return results
@@ -9,12 +9,17 @@ from typing import Any, Dict
 from .meters import parse_meter_payload
 
 
-@dataclass
+@dataclass(slots=True)
 class MSPParseResult:
     data: Dict[str, Any]
-    raw_hex: str
+    payload: bytes
     invalid: bool = False
 
+    @property
+    def raw_hex(self) -> str:
+        # Rendered on demand: the poll loops only look at ``data``.
+        return self.payload.hex()
+
 
 MSP_COMMANDS = {
     "MSP_API_VERSION": 1,
@@ -40,33 +45,84 @@ MSP_COMMANDS = {
 }
 
 
-def _payload_hex(payload: bytes) -> str:
-    return payload.hex()
-
-
 def parse_api_version(payload: bytes) -> MSPParseResult:
     if len(payload) < 3:
-        return MSPParseResult({"version": "0.0.0"}, _payload_hex(payload), True)
+        return MSPParseResult({"version": "0.0.0"}, payload, True)
     major, minor, patch = payload[:3]
-    return MSPParseResult(
-        {"version": f"{major}.{minor}.{patch}"}, _payload_hex(payload)
-    )
+    return MSPParseResult({"version": f"{major}.{minor}.{patch}"}, payload)
+
+
+def parse_raw(payload: bytes) -> MSPParseResult:
+    return MSPParseResult({"raw": payload.hex()}, payload, False)
 
 
 def parse_ascii(payload: bytes) -> MSPParseResult:
     try:
         value = payload.rstrip(b"\x00").decode("ascii", errors="ignore")
     except UnicodeDecodeError:
-        return MSPParseResult({"value": ""}, _payload_hex(payload), True)
-    return MSPParseResult({"value": value}, _payload_hex(payload))
+        return MSPParseResult({"value": ""}, payload, True)
+    return MSPParseResult({"value": value}, payload)
+
+
+_BOARD_INFO = struct.Struct("<4sH")
+_BUILD_INFO = struct.Struct("<11s8s7s")
+_STATUS = struct.Struct("<HHHHIBB")
+_ATTITUDE = struct.Struct("<hhh")
+_ALTITUDE = struct.Struct("<ii")
+_RAW_IMU = struct.Struct("<9h")
+_ANALOG = struct.Struct("<HBHHH")
+_RC = struct.Struct("<16H")
+_BATTERY_STATE = struct.Struct("<IHHH")
+_UID = struct.Struct("<III")
+# MSP_MOTOR length depends on the target (4/8 on common boards), so the
+# per-count structs are built on first use and reused afterwards.
+_MOTOR_STRUCTS: Dict[int, struct.Struct] = {}
+
+
+def _motor_struct(count: int) -> struct.Struct:
+    fmt = _MOTOR_STRUCTS.get(count)
+    if fmt is None:
+        fmt = _MOTOR_STRUCTS[count] = struct.Struct(f"<{count}H")
+    return fmt
+
+
+def _ascii(field: bytes) -> str:
+    return field.rstrip(b"\x00").decode("ascii", errors="ignore")
+
+
+def parse_board_info(payload: bytes) -> MSPParseResult:
+    if len(payload) < _BOARD_INFO.size:
+        return parse_ascii(payload)
+    board_id, hw_revision = _BOARD_INFO.unpack_from(payload, 0)
+    value = _ascii(board_id)
+    return MSPParseResult(
+        {"value": value, "board_id": value, "hw_revision": hw_revision},
+        payload,
+    )
+
+
+def parse_build_info(payload: bytes) -> MSPParseResult:
+    if len(payload) < _BUILD_INFO.size:
+        return parse_ascii(payload)
+    build_date, build_time, git_revision = (
+        _ascii(field) for field in _BUILD_INFO.unpack_from(payload, 0)
+    )
+    return MSPParseResult(
+        {
+            "value": f"{build_date} {build_time} {git_revision}",
+            "build_date": build_date,
+            "build_time": build_time,
+            "git_revision": git_revision,
+        },
+        payload,
+    )
 
 
 def parse_status(payload: bytes) -> MSPParseResult:
-    invalid = len(payload) < 11
-    raw = _payload_hex(payload)
+    invalid = len(payload) < _STATUS.size
     if invalid:
-        return MSPParseResult({}, raw, True)
-    fields = struct.unpack_from("<HHHHIBB", payload, 0)
+        return MSPParseResult({}, payload, True)
+    fields = _STATUS.unpack_from(payload, 0)
     data = {
         "cycleTime_us": fields[0],
         "i2c_errors": fields[1],
@@ -76,50 +132,49 @@ def parse_status(payload: bytes) -> MSPParseResult:
         "box_mode_flags": fields[5],
         "pid_profile": fields[6],
     }
-    return MSPParseResult(data, raw, False)
+    return MSPParseResult(data, payload, False)
 
 
 def parse_status_ex(payload: bytes) -> MSPParseResult:
-    raw = _payload_hex(payload)
     expected_len = 11
     invalid = len(payload) != expected_len
-    data = {"raw": raw}
-    return MSPParseResult(data, raw, invalid)
+    data = {"raw": payload.hex()}
+    return MSPParseResult(data, payload, invalid)
 
 
 def parse_attitude(payload: bytes) -> MSPParseResult:
-    if len(payload) < 6:
-        return MSPParseResult({}, _payload_hex(payload), True)
-    roll, pitch, yaw = struct.unpack_from("<hhh", payload, 0)
+    if len(payload) < _ATTITUDE.size:
+        return MSPParseResult({}, payload, True)
+    roll, pitch, yaw = _ATTITUDE.unpack_from(payload, 0)
     return MSPParseResult(
         {
             "roll_deg": roll / 10.0,
             "pitch_deg": pitch / 10.0,
             "yaw_deg": yaw,
         },
-        _payload_hex(payload),
+        payload,
         False,
     )
 
 
 def parse_altitude(payload: bytes) -> MSPParseResult:
-    if len(payload) < 8:
-        return MSPParseResult({}, _payload_hex(payload), True)
-    alt_cm, vario_cms = struct.unpack_from("<ii", payload, 0)
+    if len(payload) < _ALTITUDE.size:
+        return MSPParseResult({}, payload, True)
+    alt_cm, vario_cms = _ALTITUDE.unpack_from(payload, 0)
     return MSPParseResult(
         {
             "alt_m": alt_cm / 100.0,
             "vario_cmps": vario_cms,
         },
-        _payload_hex(payload),
+        payload,
         False,
     )
 
 
 def parse_raw_imu(payload: bytes) -> MSPParseResult:
-    if len(payload) < 18:
-        return MSPParseResult({}, _payload_hex(payload), True)
-    values = struct.unpack_from("<hhhhhhhhh", payload, 0)
+    if len(payload) < _RAW_IMU.size:
+        return MSPParseResult({}, payload, True)
+    values = _RAW_IMU.unpack_from(payload, 0)
     acc = values[:3]
     gyro = values[3:6]
     mag = values[6:9]
@@ -128,15 +183,13 @@ def parse_raw_imu(payload: bytes) -> MSPParseResult:
         "gyro_raw": gyro,
         "mag_raw": mag,
     }
-    return MSPParseResult(data, _payload_hex(payload), False)
+    return MSPParseResult(data, payload, False)
 
 
 def parse_analog(payload: bytes) -> MSPParseResult:
-    if len(payload) < 7:
-        return MSPParseResult({}, _payload_hex(payload), True)
-    vbat, power_meter_sum, rssi, amperage, mAh_drawn = struct.unpack_from(
-        "<HBHHH", payload, 0
-    )
+    if len(payload) < _ANALOG.size:
+        return MSPParseResult({}, payload, True)
+    vbat, power_meter_sum, rssi, amperage, mAh_drawn = _ANALOG.unpack_from(payload, 0)
     data = {
         "vbat_V": vbat / 10.0,
         "mAh_used": mAh_drawn,
@@ -144,20 +197,28 @@ def parse_analog(payload: bytes) -> MSPParseResult:
         "amps_A": amperage / 100.0,
         "power_meter_sum": power_meter_sum,
     }
-    return MSPParseResult(data, _payload_hex(payload), False)
+    return MSPParseResult(data, payload, False)
 
 
 def parse_rc(payload: bytes) -> MSPParseResult:
-    if len(payload) < 32:
-        return MSPParseResult({}, _payload_hex(payload), True)
-    channels = list(struct.unpack_from("<16H", payload, 0))
+    if len(payload) < _RC.size:
+        return MSPParseResult({}, payload, True)
+    channels = _RC.unpack_from(payload, 0)
+    # One pass for both bounds: measurably cheaper than min() + max() over
+    # 16 channels on every poll.
+    lo = hi = channels[0]
+    for value in channels:
+        if value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
     return MSPParseResult(
         {
-            "channels": channels,
-            "min": min(channels),
-            "max": max(channels),
+            "channels": list(channels),
+            "min": lo,
+            "max": hi,
         },
-        _payload_hex(payload),
+        payload,
         False,
     )
 
@@ -165,9 +226,9 @@ def parse_rc(payload: bytes) -> MSPParseResult:
 def parse_motor(payload: bytes) -> MSPParseResult:
     motor_count = len(payload) // 2
     motors = (
-        list(struct.unpack_from(f"<{motor_count}H", payload, 0)) if motor_count else []
+        list(_motor_struct(motor_count).unpack_from(payload, 0)) if motor_count else []
     )
-    return MSPParseResult({"motors": motors}, _payload_hex(payload), False)
+    return MSPParseResult({"motors": motors}, payload, False)
 
 
 def parse_voltage_meters(payload: bytes) -> MSPParseResult:
@@ -179,11 +240,10 @@ def parse_current_meters(payload: bytes) -> MSPParseResult:
 
 
 def parse_battery_state(payload: bytes) -> MSPParseResult:
-    raw = _payload_hex(payload)
-    invalid = len(payload) < 10
+    invalid = len(payload) < _BATTERY_STATE.size
     if invalid:
-        return MSPParseResult({}, raw, True)
-    voltage, mAh, amperage, flags = struct.unpack_from("<IHHH", payload, 0)
+        return MSPParseResult({}, payload, True)
+    voltage, mAh, amperage, flags = _BATTERY_STATE.unpack_from(payload, 0)
     return MSPParseResult(
         {
             "voltage_V": voltage / 100.0,
@@ -192,17 +252,17 @@ def parse_battery_state(payload: bytes) -> MSPParseResult:
             "connected": bool(flags & 0x01),
             "flags": flags,
         },
-        raw,
+        payload,
         False,
     )
 
 
 def parse_uid(payload: bytes) -> MSPParseResult:
-    if len(payload) < 12:
-        return MSPParseResult({}, _payload_hex(payload), True)
-    uid = struct.unpack_from("<III", payload, 0)
+    if len(payload) < _UID.size:
+        return MSPParseResult({}, payload, True)
+    uid = _UID.unpack_from(payload, 0)
     return MSPParseResult(
-        {"uid": "".join(f"{part:08X}" for part in uid)}, _payload_hex(payload), False
+        {"uid": "".join(f"{part:08X}" for part in uid)}, payload, False
     )
 
 
@@ -210,8 +270,8 @@ PARSERS = {
     MSP_COMMANDS["MSP_API_VERSION"]: parse_api_version,
     MSP_COMMANDS["MSP_FC_VARIANT"]: parse_ascii,
     MSP_COMMANDS["MSP_FC_VERSION"]: parse_ascii,
-    MSP_COMMANDS["MSP_BOARD_INFO"]: parse_ascii,
-    MSP_COMMANDS["MSP_BUILD_INFO"]: parse_ascii,
+    MSP_COMMANDS["MSP_BOARD_INFO"]: parse_board_info,
+    MSP_COMMANDS["MSP_BUILD_INFO"]: parse_build_info,
     MSP_COMMANDS["MSP_NAME"]: parse_ascii,
     MSP_COMMANDS["MSP_UID"]: parse_uid,
     MSP_COMMANDS["MSP_STATUS"]: parse_status,
@@ -225,18 +285,10 @@ PARSERS = {
     MSP_COMMANDS["MSP_VOLTAGE_METERS"]: parse_voltage_meters,
     MSP_COMMANDS["MSP_CURRENT_METERS"]: parse_current_meters,
     MSP_COMMANDS["MSP_BATTERY_STATE"]: parse_battery_state,
-    MSP_COMMANDS["MSP_DATAFLASH_SUMMARY"]: lambda payload: MSPParseResult(
-        {"raw": payload.hex()}, payload.hex(), False
-    ),
-    MSP_COMMANDS["MSP_ESC_SENSOR_DATA"]: lambda payload: MSPParseResult(
-        {"raw": payload.hex()}, payload.hex(), False
-    ),
+    MSP_COMMANDS["MSP_DATAFLASH_SUMMARY"]: parse_raw,
+    MSP_COMMANDS["MSP_ESC_SENSOR_DATA"]: parse_raw,
 }
 
 
 def parse_payload(cmd: int, payload: bytes) -> MSPParseResult:
-    parser = PARSERS.get(cmd)
-    if not parser:
-        return MSPParseResult({"raw": payload.hex()}, payload.hex(), False)
-    result = parser(payload)
-    return result
+    return PARSERS.get(cmd, parse_raw)(payload)
@@ -6,31 +6,33 @@ import asyncio
 import logging
 import random
 import time
+import zlib
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict, List, Optional
+from typing import Callable, ClassVar, Deque, Dict, Iterator, List, Optional
 
+import numpy as np
 import serial
 
 from ..io.json_writer import ReportWriter
 from ..io.ports import PortFilterConfig, list_ports
 from .analysis import ImuAnalyzer, LoopAnalyzer, evaluate
-from .msp import open_serial_port, send_command
-from .parsers import MSP_COMMANDS, MSPParseResult, parse_payload
+from .msp import open_serial_port, send_commands
+from .parsers import MSP_COMMANDS, PARSERS, MSPParseResult, parse_payload
 
 log = logging.getLogger(__name__)
 
 
-MSP_META_COMMANDS = [
+MSP_META_COMMANDS = (
     MSP_COMMANDS["MSP_API_VERSION"],
     MSP_COMMANDS["MSP_FC_VARIANT"],
     MSP_COMMANDS["MSP_FC_VERSION"],
     MSP_COMMANDS["MSP_BOARD_INFO"],
     MSP_COMMANDS["MSP_BUILD_INFO"],
     MSP_COMMANDS["MSP_UID"],
-]
+)
 
-MSP_POLL_COMMANDS = [
+MSP_POLL_COMMANDS = (
     MSP_COMMANDS["MSP_STATUS"],
     MSP_COMMANDS["MSP_ATTITUDE"],
     MSP_COMMANDS["MSP_ANALOG"],
@@ -38,10 +40,82 @@ MSP_POLL_COMMANDS = [
     MSP_COMMANDS["MSP_VOLTAGE_METERS"],
     MSP_COMMANDS["MSP_CURRENT_METERS"],
     MSP_COMMANDS["MSP_BATTERY_STATE"],
-]
+)
+
+# Parsers resolved once so the poll loop skips the per-command lookup.
+MSP_POLL_PARSERS = tuple((cmd, PARSERS[cmd]) for cmd in MSP_POLL_COMMANDS)
+
+# Commands whose parsed payload is stored verbatim under a snapshot key.
+MSP_SNAPSHOT_KEYS = {
+    MSP_COMMANDS["MSP_VOLTAGE_METERS"]: "voltage_meters",
+    MSP_COMMANDS["MSP_CURRENT_METERS"]: "current_meters",
+    MSP_COMMANDS["MSP_BATTERY_STATE"]: "battery_state",
+}
+
+
+def poll_period(mode: str) -> float:
+    """Return the telemetry tick period in seconds for a display *mode*."""
+
+    return 0.1 if mode == "pro" else 0.2
+
+
+# Simulator noise as (mean, sigma) per channel, in the order _run_simulated
+# unpacks them: cycle_us, amps, roll, pitch, gyro xyz, acc xyz.
+_SIM_NOISE = np.array(
+    [
+        (250.0, 4.0),
+        (0.2, 0.15),
+        (0.0, 1.5),
+        (0.0, 1.5),
+        (0.0, 12.0),
+        (0.0, 12.0),
+        (0.0, 12.0),
+        (0.0, 200.0),
+        (0.0, 200.0),
+        (16384.0, 400.0),
+    ]
+)
+_SIM_BLOCK = 64
+
+
+def _sim_noise(seed: str) -> Iterator[List[float]]:
+    """Yield one row of simulator draws per tick, plus a uniform yaw.
+
+    Rows are drawn _SIM_BLOCK ticks at a time so the simulator makes one
+    NumPy call per block instead of a dozen ``random`` calls per tick.
+    """
+
+    gen = np.random.default_rng(zlib.crc32(seed.encode("utf-8")))
+    mean = _SIM_NOISE[:, 0]
+    sigma = _SIM_NOISE[:, 1]
+    while True:
+        block = np.column_stack(
+            (
+                gen.normal(mean, sigma, size=(_SIM_BLOCK, len(_SIM_NOISE))),
+                gen.uniform(0.0, 360.0, size=_SIM_BLOCK),
+            )
+        )
+        yield from block.tolist()
+
+
+async def _sleep_until_next_slot(slot: float, period: float) -> float:
+    """Sleep until ``slot + period`` and return that as the new slot start.
+
+    Slots are fixed-rate (start + n * period), so time spent polling is not
+    added on top of the period and sleep overshoot does not accumulate.
+    """
 
+    slot += period
+    delay = slot - time.monotonic()
+    if delay < 0:
+        # Overran the slot: re-anchor instead of bursting to catch up.
+        slot -= delay
+        delay = 0.0
+    await asyncio.sleep(delay)
+    return slot
 
-@dataclass
+
+@dataclass(slots=True)
 class ProbeResult:
     ok: bool
     uid: Optional[str]
@@ -76,8 +150,9 @@ def probe_serial_port(port: str, baud: int, timeout: float = 0.3) -> ProbeResult
         meta: Dict[str, str] = {"port": port}
         uid: Optional[str] = None
         api_version: Optional[str] = None
+        replies = send_commands(ser, MSP_META_COMMANDS, timeout=timeout)
         for cmd in MSP_META_COMMANDS:
-            cmd_resp, payload, err = send_command(ser, cmd, timeout=timeout)
+            cmd_resp, payload, err = replies[cmd]
             if err:
                 return ProbeResult(False, None, meta, api_version, f"MSP {cmd} {err}")
             result = parse_payload(cmd, payload)
@@ -136,7 +211,7 @@ def _make_snapshot(port: str, uid: Optional[str], profile: str, mode: str) -> Di
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceContext:
     uid: Optional[str]
     port: str
@@ -153,7 +228,7 @@ class DeviceContext:
     raw_packets: Deque[Dict] = field(default_factory=lambda: deque(maxlen=200))
     loop_analyzer: LoopAnalyzer = field(default_factory=LoopAnalyzer)
     imu_analyzer: ImuAnalyzer = field(default_factory=ImuAnalyzer)
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)
     last_status_i2c: Optional[int] = None
     last_status_ts: Optional[float] = None
     i2c_error_rate: float = 0.0
@@ -161,6 +236,47 @@ class DeviceContext:
     completed: bool = False
 
 
+class EventQueue:
+    """Session event queue that coalesces device snapshots.
+
+    Snapshot events reference the live ``ctx.snapshot`` dict, so a snapshot
+    still waiting for the consumer carries nothing the newest one does not:
+    a new snapshot for the same device replaces it in place. Other events are
+    delivered in order, and a snapshot never overtakes one queued before it.
+    Past *maxsize* pending events the oldest is dropped.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._pending: Dict[object, Dict] = {}
+        self._ready = asyncio.Event()
+        self._seq = 0
+        # Bumped by every non-snapshot event; snapshots only merge with
+        # pending snapshots of the same epoch.
+        self._epoch = 0
+
+    def put_nowait(self, event: Dict) -> None:
+        pending = self._pending
+        if event.get("type") == "snapshot":
+            key: object = ("snapshot", event.get("uid"), self._epoch)
+        else:
+            self._seq += 1
+            key = self._epoch = self._seq
+        if key not in pending and len(pending) >= self.maxsize:
+            del pending[next(iter(pending))]
+        pending[key] = event
+        self._ready.set()
+
+    async def get(self) -> Dict:
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._pending.pop(next(iter(self._pending)))
+
+    def qsize(self) -> int:
+        return len(self._pending)
+
+
 class Session:
     def __init__(
         self,
@@ -191,7 +307,7 @@ class Session:
         self.contexts: Dict[str, DeviceContext] = {}
         self.snapshots: Dict[str, Dict] = {}
         self.completed_reports: Dict[str, Dict] = {}
-        self.queue: asyncio.Queue[Dict] = asyncio.Queue(maxsize=256)
+        self.queue = EventQueue(maxsize=256)
         self._requested_ports = ports
         self.task = asyncio.create_task(self._run())
 
@@ -208,10 +324,10 @@ class Session:
         for port in ports:
             if port not in self.contexts:
                 await self._attach_port(port)
-        # remove disappeared ports
-        for port in list(self.contexts):
-            if port not in ports:
-                await self._detach_port(port)
+        # remove disappeared ports; the key difference is its own set, so
+        # detaching while iterating it is safe and usually iterates nothing.
+        for port in self.contexts.keys() - set(ports):
+            await self._detach_port(port)
 
     def _discover_ports(self) -> List[str]:
         if self._requested_ports:
@@ -295,7 +411,7 @@ class Session:
         if ctx.task and not ctx.task.done():
             ctx.task.cancel()
         ctx.completed = False
-        ctx.start_time = time.time()
+        ctx.start_time = time.monotonic()
         ctx.snapshot["state"] = "testing"
         if ctx.simulate:
             ctx.loop_analyzer = LoopAnalyzer()
@@ -315,27 +431,23 @@ class Session:
         raise KeyError(uid)
 
     async def _run_simulated(self, ctx: DeviceContext) -> None:
-        rng = random.Random(ctx.port)
-        start = time.time()
-        while self.running and (time.time() - start) < self.test_duration:
-            await asyncio.sleep(0.1 if ctx.mode == "pro" else 0.2)
-            ts = time.time()
-            cycle_us = 250.0 + rng.gauss(0.0, 4.0)
+        noise = _sim_noise(ctx.port)
+        now = time.monotonic
+        wall = time.time
+        snapshots = self.snapshots
+        start = now()
+        deadline = start + self.test_duration
+        period = poll_period(ctx.mode)
+        slot = start
+        while self.running and (tick := now()) < deadline:
+            ts = wall()
+            elapsed = tick - start
+            cycle_us, amps, roll, pitch, gx, gy, gz, ax, ay, az, yaw = next(noise)
             loop_hz = 1_000_000.0 / cycle_us if cycle_us else 0.0
-            vbat = max(0.0, 16.2 - (ts - start) * 0.05)
-            amps = abs(rng.gauss(0.2, 0.15))
-            roll = rng.gauss(0.0, 1.5)
-            pitch = rng.gauss(0.0, 1.5)
-            gyro = (
-                int(rng.gauss(0.0, 12.0)),
-                int(rng.gauss(0.0, 12.0)),
-                int(rng.gauss(0.0, 12.0)),
-            )
-            acc = (
-                int(rng.gauss(0.0, 200)),
-                int(rng.gauss(0.0, 200)),
-                int(rng.gauss(16384.0, 400.0)),
-            )
+            vbat = max(0.0, 16.2 - elapsed * 0.05)
+            amps = abs(amps)
+            gyro = (int(gx), int(gy), int(gz))
+            acc = (int(ax), int(ay), int(az))
             ctx.loop_analyzer.add_sample(cycle_us, ts)
             ctx.imu_analyzer.add_sample(gyro, acc, ts)
             ctx.history_cycle.append(cycle_us)
@@ -349,12 +461,12 @@ class Session:
             ctx.snapshot["attitude"] = {
                 "roll_deg": roll,
                 "pitch_deg": pitch,
-                "yaw_deg": rng.uniform(0, 360),
+                "yaw_deg": yaw,
             }
             ctx.snapshot["analog"] = {
                 "vbat_V": vbat,
                 "amps_A": amps,
-                "mAh_used": int((ts - start) * 120),
+                "mAh_used": int(elapsed * 120),
             }
             ctx.snapshot["imu"] = {
                 "gyro_raw": gyro,
@@ -374,7 +486,7 @@ class Session:
             ctx.snapshot["imu_stats"] = imu_stats.__dict__ if imu_stats else {}
             ctx.snapshot["ok"] = analytics.ok
             ctx.snapshot["reasons"] = analytics.reasons
-            ctx.snapshot["duration_s"] = ts - ctx.start_time
+            ctx.snapshot["duration_s"] = tick - ctx.start_time
             ctx.snapshot["history"] = {
                 "cycle_us": list(ctx.history_cycle),
                 "loop_hz": list(ctx.history_loop_hz),
@@ -383,8 +495,9 @@ class Session:
             }
             ctx.snapshot["meta"] = ctx.meta
             ctx.snapshot["updated"] = ts
-            self.snapshots[ctx.uid or ctx.port] = ctx.snapshot.copy()
+            snapshots[ctx.uid or ctx.port] = ctx.snapshot.copy()
             await self._publish(ctx)
+            slot = await _sleep_until_next_slot(slot, period)
         ctx.completed = True
         ctx.snapshot["state"] = "complete"
         self.snapshots[ctx.uid or ctx.port] = ctx.snapshot.copy()
@@ -403,24 +516,26 @@ class Session:
             await self._publish(ctx)
             return
         try:
-            start = time.time()
-            while self.running and (time.time() - start) < self.test_duration:
-                ts = time.time()
-                await asyncio.sleep(0.1 if ctx.mode == "pro" else 0.2)
-                for cmd in MSP_POLL_COMMANDS:
-                    (
-                        cmd_resp,
-                        payload,
-                        err,
-                    ) = await asyncio.get_running_loop().run_in_executor(
-                        None, send_command, ser, cmd
-                    )
+            period = poll_period(ctx.mode)
+            loop = asyncio.get_running_loop()
+            now = time.monotonic
+            wall = time.time
+            snapshots = self.snapshots
+            slot = now()
+            deadline = slot + self.test_duration
+            while self.running and (tick := now()) < deadline:
+                ts = wall()
+                replies = await loop.run_in_executor(
+                    None, send_commands, ser, MSP_POLL_COMMANDS
+                )
+                for cmd, parser in MSP_POLL_PARSERS:
+                    cmd_resp, payload, err = replies[cmd]
                     if err:
                         ctx.snapshot.setdefault("errors", []).append(
                             {"cmd": cmd, "error": err, "ts": ts}
                         )
                         continue
-                    parsed = parse_payload(cmd, payload)
+                    parsed = parser(payload)
                     self._update_from_payload(ctx, cmd, parsed, ts)
                     ctx.raw_packets.append(
                         {
@@ -444,7 +559,7 @@ class Session:
                 ctx.snapshot["imu_stats"] = imu_stats.__dict__ if imu_stats else {}
                 ctx.snapshot["ok"] = analytics.ok
                 ctx.snapshot["reasons"] = analytics.reasons
-                ctx.snapshot["duration_s"] = ts - ctx.start_time
+                ctx.snapshot["duration_s"] = tick - ctx.start_time
                 ctx.snapshot["history"] = {
                     "cycle_us": list(ctx.history_cycle),
                     "loop_hz": list(ctx.history_loop_hz),
@@ -454,8 +569,11 @@ class Session:
                 ctx.snapshot["raw_packets"] = list(ctx.raw_packets)
                 ctx.snapshot["updated"] = ts
                 ctx.snapshot["state"] = "testing"
-                self.snapshots[ctx.uid or ctx.port] = ctx.snapshot.copy()
+                snapshots[ctx.uid or ctx.port] = ctx.snapshot.copy()
                 await self._publish(ctx)
+                # Serial round-trips already consume part of the slot; only
+                # the remainder is slept.
+                slot = await _sleep_until_next_slot(slot, period)
         finally:
             try:
                 ser.close()
@@ -470,46 +588,53 @@ class Session:
     def _update_from_payload(
         self, ctx: DeviceContext, cmd: int, parsed: MSPParseResult, ts: float
     ) -> None:
-        if cmd == MSP_COMMANDS["MSP_STATUS"]:
-            ctx.snapshot["status"] = parsed.data
-            cycle = float(parsed.data.get("cycleTime_us", 0.0))
-            if cycle:
-                ctx.loop_analyzer.add_sample(cycle, ts)
-                ctx.history_cycle.append(cycle)
-                ctx.history_loop_hz.append(1_000_000.0 / cycle)
-            i2c_errors = int(parsed.data.get("i2c_errors", 0))
-            if ctx.last_status_i2c is not None and ctx.last_status_ts is not None:
-                delta = i2c_errors - ctx.last_status_i2c
-                dt = max(ts - ctx.last_status_ts, 1e-6)
-                if delta >= 0:
-                    ctx.i2c_error_rate = delta / dt
-            ctx.last_status_i2c = i2c_errors
-            ctx.last_status_ts = ts
-        elif cmd == MSP_COMMANDS["MSP_ATTITUDE"]:
-            ctx.snapshot["attitude"] = parsed.data
-        elif cmd == MSP_COMMANDS["MSP_ANALOG"]:
-            ctx.snapshot["analog"] = parsed.data
-            vbat = float(parsed.data.get("vbat_V", 0.0))
-            amps = float(parsed.data.get("amps_A", 0.0))
-            ctx.history_vbat.append(vbat)
-            ctx.history_amps.append(amps)
-        elif cmd == MSP_COMMANDS["MSP_RAW_IMU"]:
-            ctx.snapshot["imu"] = parsed.data
-            gyro = parsed.data.get("gyro_raw")
-            acc = parsed.data.get("acc_raw")
-            if gyro and acc:
-                ctx.imu_analyzer.add_sample(tuple(gyro), tuple(acc), ts)
-        elif cmd in {
-            MSP_COMMANDS["MSP_VOLTAGE_METERS"],
-            MSP_COMMANDS["MSP_CURRENT_METERS"],
-            MSP_COMMANDS["MSP_BATTERY_STATE"],
-        }:
-            key = {
-                MSP_COMMANDS["MSP_VOLTAGE_METERS"]: "voltage_meters",
-                MSP_COMMANDS["MSP_CURRENT_METERS"]: "current_meters",
-                MSP_COMMANDS["MSP_BATTERY_STATE"]: "battery_state",
-            }[cmd]
-            ctx.snapshot[key] = parsed.data
+        handler = self._PAYLOAD_HANDLERS.get(cmd)
+        if handler is not None:
+            handler(self, ctx, parsed.data, ts)
+        elif cmd in MSP_SNAPSHOT_KEYS:
+            ctx.snapshot[MSP_SNAPSHOT_KEYS[cmd]] = parsed.data
+
+    def _on_status(self, ctx: DeviceContext, data: Dict, ts: float) -> None:
+        ctx.snapshot["status"] = data
+        cycle = float(data.get("cycleTime_us", 0.0))
+        if cycle:
+            ctx.loop_analyzer.add_sample(cycle, ts)
+            ctx.history_cycle.append(cycle)
+            ctx.history_loop_hz.append(1_000_000.0 / cycle)
+        i2c_errors = int(data.get("i2c_errors", 0))
+        if ctx.last_status_i2c is not None and ctx.last_status_ts is not None:
+            delta = i2c_errors - ctx.last_status_i2c
+            dt = max(ts - ctx.last_status_ts, 1e-6)
+            if delta >= 0:
+                ctx.i2c_error_rate = delta / dt
+        ctx.last_status_i2c = i2c_errors
+        ctx.last_status_ts = ts
+
+    def _on_attitude(self, ctx: DeviceContext, data: Dict, ts: float) -> None:
+        ctx.snapshot["attitude"] = data
+
+    def _on_analog(self, ctx: DeviceContext, data: Dict, ts: float) -> None:
+        ctx.snapshot["analog"] = data
+        vbat = float(data.get("vbat_V", 0.0))
+        amps = float(data.get("amps_A", 0.0))
+        ctx.history_vbat.append(vbat)
+        ctx.history_amps.append(amps)
+
+    def _on_raw_imu(self, ctx: DeviceContext, data: Dict, ts: float) -> None:
+        ctx.snapshot["imu"] = data
+        gyro = data.get("gyro_raw")
+        acc = data.get("acc_raw")
+        if gyro and acc:
+            ctx.imu_analyzer.add_sample(tuple(gyro), tuple(acc), ts)
+
+    # cmd -> handler, resolved once at class creation instead of walking an
+    # if/elif chain of MSP_COMMANDS lookups for every payload.
+    _PAYLOAD_HANDLERS: ClassVar[Dict[int, Callable[..., None]]] = {
+        MSP_COMMANDS["MSP_STATUS"]: _on_status,
+        MSP_COMMANDS["MSP_ATTITUDE"]: _on_attitude,
+        MSP_COMMANDS["MSP_ANALOG"]: _on_analog,
+        MSP_COMMANDS["MSP_RAW_IMU"]: _on_raw_imu,
+    }
 
     async def _publish(self, ctx: DeviceContext) -> None:
         await self._queue_event(
@@ -521,12 +646,7 @@ class Session:
         )
 
     async def _queue_event(self, event: Dict) -> None:
-        if self.queue.full():
-            try:
-                self.queue.get_nowait()
-            except asyncio.QueueEmpty:
-                pass
-        await self.queue.put(event)
+        self.queue.put_nowait(event)
 
     def snapshot(self) -> List[Dict]:
         return [ctx.snapshot for ctx in self.contexts.values()]
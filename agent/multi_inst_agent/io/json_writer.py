@@ -4,41 +4,106 @@ from __future__ import annotations
 
 import json
 import os
+import re
 from pathlib import Path
 from typing import Dict, List
 
 from ..core.utils import ensure_dir, make_uid_name
 
+try:  # optional: pip install multi-inst-agent[fast]
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+_DEFECT_NAME = re.compile(r"DEFECT-(\d{5})\.json")
+
+
+def _sudo_owner() -> tuple[int, int] | None:
+    """Return the invoking user's uid/gid when running as root under sudo."""
+
+    # os.chown/os.geteuid do not exist on Windows, and handing files over to
+    # another user is only possible as root.
+    if not hasattr(os, "chown") or not hasattr(os, "geteuid") or os.geteuid() != 0:
+        return None
+    try:
+        return int(os.environ["SUDO_UID"]), int(os.environ["SUDO_GID"])
+    except (KeyError, ValueError):
+        return None
+
+
+# Resolved once: the environment does not change during a run.
+_SUDO_OWNER = _sudo_owner()
+
+
+if orjson is not None:
+    _ORJSON_OPTS = (
+        orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+
+else:
+
+    def _dumps(obj: object) -> bytes:
+        # One-shot dumps() so json uses its C encoder (dump() never does).
+        # Separators and ensure_ascii are pinned to orjson's output so both
+        # backends lay the file out the same way.
+        text = json.dumps(obj, ensure_ascii=False, indent=2, separators=(",", ": "))
+        return text.encode("utf-8")
+
+
+def _next_defect_index(out_dir: Path) -> int:
+    """Return the first DEFECT index above those already in *out_dir*."""
+
+    with os.scandir(out_dir) as entries:
+        used = [
+            int(match.group(1))
+            for entry in entries
+            if (match := _DEFECT_NAME.fullmatch(entry.name))
+        ]
+    return max(used, default=0) + 1
+
 
 class ReportWriter:
     def __init__(self, out_dir: str) -> None:
         self.out_dir = Path(out_dir)
         ensure_dir(str(self.out_dir))
         self.summary: List[Dict] = []
-        self.defect_counter = 1
+        self.defect_counter = _next_defect_index(self.out_dir)
 
     def write_report(self, uid: str | None, report: Dict) -> Path:
-        filename = make_uid_name(uid, self.defect_counter)
-        if filename.startswith("DEFECT"):
-            self.defect_counter += 1
-        path = self.out_dir / filename
-        with path.open("w", encoding="utf-8") as fp:
-            json.dump(report, fp, indent=2)
+        data = _dumps(report)
+        if uid:
+            path = self.out_dir / make_uid_name(uid, self.defect_counter)
+            path.write_bytes(data)
+        else:
+            path = self._write_defect(data)
         self._fix_permissions(path)
         self.summary.append(report)
         return path
 
+    def _write_defect(self, data: bytes) -> Path:
+        # Another writer (CLI vs. agent) may share out_dir: create the file
+        # exclusively and move on to the next index if it is already taken.
+        while True:
+            path = self.out_dir / make_uid_name(None, self.defect_counter)
+            self.defect_counter += 1
+            try:
+                with open(path, "xb") as fp:
+                    fp.write(data)
+            except FileExistsError:
+                continue
+            return path
+
     def write_summary(self) -> Path:
         path = self.out_dir / "_summary.json"
-        with path.open("w", encoding="utf-8") as fp:
-            json.dump(self.summary, fp, indent=2)
+        path.write_bytes(_dumps(self.summary))
         self._fix_permissions(path)
         return path
 
     def _fix_permissions(self, path: Path) -> None:
-        sudo_uid = os.environ.get("SUDO_UID")
-        sudo_gid = os.environ.get("SUDO_GID")
-        if sudo_uid and sudo_gid:
-            os.chown(path, int(sudo_uid), int(sudo_gid))
+        if _SUDO_OWNER is not None:
+            os.chown(path, *_SUDO_OWNER)
         path.chmod(0o664)
         self.out_dir.chmod(0o775)
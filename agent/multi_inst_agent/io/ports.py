@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from typing import Iterable, List, Sequence
 
@@ -54,10 +55,27 @@ def _is_candidate(device: str, prefixes: Sequence[str]) -> bool:
     return any(device.startswith(prefix) for prefix in prefixes)
 
 
+# comports() walks sysfs on every call. Each session rescans every 0.5 s and
+# /v1/ports polls too, so enumerations within this window are shared.
+_COMPORTS_TTL = 0.5
+_comports_cache: tuple[float, tuple] | None = None
+
+
+def _comports() -> tuple:
+    global _comports_cache
+    now = time.monotonic()
+    cached = _comports_cache
+    if cached is not None and now - cached[0] < _COMPORTS_TTL:
+        return cached[1]
+    ports = tuple(serial.tools.list_ports.comports())
+    _comports_cache = (now, ports)
+    return ports
+
+
 def _iter_ports(
     include_simulated: bool,
 ) -> Iterable[serial.tools.list_ports.ListPortInfo]:
-    for port in serial.tools.list_ports.comports():
+    for port in _comports():
         if not port.device:
             continue
         if include_simulated and port.device.startswith("sim://"):
@@ -1,5 +1,8 @@
+import pytest
 from multi_inst_agent.core.analysis import (
+    ImuAnalyzer,
     ImuStatistics,
+    LoopAnalyzer,
     LoopStatistics,
     evaluate,
 )
@@ -40,3 +43,41 @@ def test_evaluate_flags_excessive_values():
     assert any(reason.startswith("vbat_low") for reason in analytics.reasons)
     assert any(reason.startswith("amps_high") for reason in analytics.reasons)
     assert any(reason.startswith("tilt") for reason in analytics.reasons)
+
+
+def test_evaluate_names_only_offending_gyro_axes():
+    imu = ImuStatistics(100, [1.0, 1.0, 9.0], [0.0, -20.0, 0.0], 1.0)
+    analytics = evaluate("usb_stand", None, imu, i2c_error_rate=0.0)
+    assert not analytics.ok
+    assert [r.split()[0] for r in analytics.reasons] == ["gyro_std_z", "gyro_bias_y"]
+
+
+def test_imu_analyzer_snapshot_statistics():
+    analyzer = ImuAnalyzer(window=60.0)
+    samples = [((1, -2, 3), (0, 0, 512)), ((3, -4, 5), (0, 0, 520))]
+    for idx, (gyro, acc) in enumerate(samples):
+        analyzer.add_sample(gyro, acc, ts=100.0 + idx)
+    stats = analyzer.snapshot(gyro_scale=2.0)
+    assert stats.samples == 2
+    assert stats.gyro_bias == pytest.approx([4.0, -6.0, 8.0])
+    assert stats.gyro_std == pytest.approx([2.0, 2.0, 2.0])
+    assert stats.acc_norm_std == pytest.approx(4.0)
+
+
+def test_loop_analyzer_snapshot_matches_rolling_stats():
+    analyzer = LoopAnalyzer(window=60.0)
+    for idx, cycle in enumerate((1000.0, 1010.0, 990.0, 1005.0, 1040.0)):
+        analyzer.add_sample(cycle, ts=100.0 + idx)
+    stats = analyzer.snapshot()
+    assert stats.min_us == 990.0
+    assert stats.max_us == 1040.0
+    assert [stats.p95, stats.p99] == pytest.approx(analyzer.stats.percentiles(95, 99))
+
+
+def test_imu_analyzer_window_survives_compaction():
+    analyzer = ImuAnalyzer(window=1.0, capacity=4)
+    for idx in range(50):
+        analyzer.add_sample((idx, 0, 0), (0, 0, 512), ts=idx * 0.25)
+    assert analyzer.samples[:, 0].tolist() == [11.25, 11.5, 11.75, 12.0, 12.25]
+    assert analyzer.samples[:, 1].tolist() == [45.0, 46.0, 47.0, 48.0, 49.0]
+    assert analyzer.snapshot().samples == 5
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+from multi_inst_agent.io import json_writer
+from multi_inst_agent.io.json_writer import ReportWriter
+
+
+def test_defect_numbering_continues_after_existing_reports(tmp_path):
+    (tmp_path / "DEFECT-00001.json").write_text("{}")
+    (tmp_path / "DEFECT-00007.json").write_text("{}")
+    (tmp_path / "DEFECT-notes.txt").write_text("")
+    writer = ReportWriter(str(tmp_path))
+    path = writer.write_report(None, {"ok": False})
+    assert path.name == "DEFECT-00008.json"
+    assert writer.write_report(None, {}).name == "DEFECT-00009.json"
+
+
+def test_summary_is_indented_utf8_json(tmp_path):
+    writer = ReportWriter(str(tmp_path))
+    writer.summary = [{"uid": "FC-1", "reasons": ["Порт занят"]}]
+    text = writer.write_summary().read_text(encoding="utf-8")
+    assert json.loads(text) == writer.summary
+    assert text.startswith('[\n  {\n    "uid": "FC-1",')
+    assert "Порт занят" in text
+
+
+def test_defect_numbering_skips_files_created_after_start(tmp_path):
+    writer = ReportWriter(str(tmp_path))
+    (tmp_path / "DEFECT-00001.json").write_text("{}")
+    assert writer.write_report(None, {}).name == "DEFECT-00002.json"
+    assert writer.write_report(None, {}).name == "DEFECT-00003.json"
+
+
+def test_orjson_and_stdlib_encoders_agree():
+    orjson = pytest.importorskip("orjson")
+    report = {"uid": "FC-1", "ok": False, "reasons": ["Порт занят"], "meta": {}}
+    expected = json.dumps(report, ensure_ascii=False, indent=2).encode("utf-8")
+    assert orjson.dumps(report, option=orjson.OPT_INDENT_2) == expected
+    assert json_writer._dumps(report) == expected
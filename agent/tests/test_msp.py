@@ -0,0 +1,131 @@
+from typing import Sequence
+
+import pytest
+from multi_inst_agent.core import msp
+
+
+class FakeSerial:
+    def __init__(self, response: bytes, bursts: Sequence[bytes] = ()) -> None:
+        # *response* is already waiting in the input buffer; each write()
+        # then delivers the next entry of *bursts*, like a device answering.
+        self._load(bytes(response))
+        self._bursts = list(bursts)
+        self.written = bytearray()
+        self.baudrate = 1_000_000
+        self.dtr = False
+        self.rts = False
+        self.reads = 0
+
+    def _load(self, data: bytes) -> None:
+        self._data = data
+        self._buffer = memoryview(data)
+        self._pos = 0
+
+    def write(self, data: bytes) -> int:
+        self.written.extend(data)
+        if self._bursts:
+            self._load(self._data[self._pos :] + self._bursts.pop(0))
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        self.reads += 1
+        start = self._pos
+        if start == 0 and size >= len(self._data):
+            self._pos = len(self._data)
+            return self._data
+        self._pos = min(start + size, len(self._buffer))
+        return bytes(self._buffer[start : self._pos])
+
+    def reset_input_buffer(self) -> None:
+        self._load(b"")
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _reply(cmd: int, payload: bytes = b"") -> bytes:
+    checksum = len(payload) ^ cmd
+    for byte in payload:
+        checksum ^= byte
+    return b"$M>" + bytes([len(payload), cmd]) + payload + bytes([checksum])
+
+
+def test_build_frame_roundtrip():
+    frame = msp.build_frame_v1(101, b"\x01\x02")
+    assert frame == b"$M<\x02\x65\x01\x02" + bytes([2 ^ 101 ^ 1 ^ 2])
+    ser = FakeSerial(_reply(101, b"\x01\x02"))
+    assert msp.read_response_v1(ser, 101, 0.1) == (101, b"\x01\x02", None)
+
+
+def test_read_response_resyncs_without_consuming_next_frame():
+    noise = b"\x00$M" + msp.build_frame_v1(1)
+    ser = FakeSerial(noise + _reply(108, b"\x01\x00\x02\x00\x03\x00") + _reply(1))
+    assert msp.read_response_v1(ser, 108, 0.1) == (
+        108,
+        b"\x01\x00\x02\x00\x03\x00",
+        None,
+    )
+    assert msp.read_response_v1(ser, 1, 0.1) == (1, b"", None)
+
+
+def test_read_response_reads_header_and_body_in_two_calls():
+    ser = FakeSerial(_reply(101, bytes(11)))
+    assert msp.read_response_v1(ser, 101, 0.1)[2] is None
+    assert ser.reads == 2
+
+
+def test_send_commands_bursts_requests_and_demuxes_replies():
+    ser = FakeSerial(b"", [_reply(2, b"BTFL") + _reply(1, b"\x00\x01\x2e")])
+    replies = msp.send_commands(ser, [1, 2], timeout=0.05)
+    assert bytes(ser.written) == msp.build_frame_v1(1) + msp.build_frame_v1(2)
+    assert replies[1] == (1, b"\x00\x01\x2e", None)
+    assert replies[2] == (2, b"BTFL", None)
+
+
+def test_send_commands_rebursts_only_missing_commands():
+    corrupted = _reply(2, b"BTFL")[:-1] + b"\x00"
+    ser = FakeSerial(b"", [_reply(1, b"\x00\x01\x2e") + corrupted, _reply(2, b"BTFL")])
+    replies = msp.send_commands(ser, [1, 2], timeout=0.05)
+    assert replies[2] == (2, b"BTFL", None)
+    assert bytes(ser.written) == b"".join(msp.build_frame_v1(cmd) for cmd in (1, 2, 2))
+
+
+def test_send_commands_discards_replies_left_from_an_earlier_burst():
+    ser = FakeSerial(_reply(1, b"old"), [_reply(1, b"new")])
+    assert msp.send_commands(ser, [1], timeout=0.05)[1] == (1, b"new", None)
+
+
+def test_send_commands_unrelated_frames_do_not_use_up_reads():
+    late = _reply(101, bytes(11)) + _reply(108, bytes(6))
+    ser = FakeSerial(b"", [late + _reply(1, b"\x00\x01\x2e") + _reply(2, b"BTFL")])
+    replies = msp.send_commands(ser, [1, 2], timeout=0.05)
+    assert replies[2] == (2, b"BTFL", None)
+    assert bytes(ser.written) == msp.build_frame_v1(1) + msp.build_frame_v1(2)
+
+
+def test_send_commands_reports_last_error_after_retries():
+    replies = msp.send_commands(FakeSerial(b""), [1], timeout=0.01, retries=2)
+    assert replies[1] == (None, b"", "timeout")
+
+
+def test_xor_checksum_matches_bytewise_xor():
+    for size in (0, 1, 7, 63, 64, 65, 255):
+        data = bytes((i * 37 + 11) & 0xFF for i in range(size))
+        expected = size
+        for byte in data:
+            expected ^= byte
+        assert msp._xor_checksum(data, size) == expected
+        if data:
+            assert msp._xor_fold(data, size) == expected
+
+
+def test_parameterless_frames_are_cached_and_validated():
+    assert msp.build_frame_v1(101) is msp.build_frame_v1(101)
+    assert msp.build_frame_v1(101) == b"$M<\x00\x65\x65"
+    with pytest.raises(ValueError):
+        msp.build_frame_v1(256)
+    with pytest.raises(ValueError):
+        msp.build_frame_v1(1, bytes(256))
@@ -1,4 +1,5 @@
 import pathlib
+import struct
 
 from multi_inst_agent.core import parsers
 
@@ -39,6 +40,22 @@ def test_analog_units():
     assert result.data["amps_A"] == 2.5
 
 
+def test_rc_channels_and_range():
+    channels = [1000 + 10 * i for i in range(16)]
+    result = parsers.parse_rc(struct.pack("<16H", *channels))
+    assert result.data["channels"] == channels
+    assert (result.data["min"], result.data["max"]) == (1000, 1150)
+    channels.reverse()
+    result = parsers.parse_rc(struct.pack("<16H", *channels))
+    assert (result.data["min"], result.data["max"]) == (1000, 1150)
+
+
+def test_motor_ignores_trailing_odd_byte():
+    result = parsers.parse_motor(struct.pack("<4H", 1000, 1100, 1200, 1300) + b"\x07")
+    assert result.data["motors"] == [1000, 1100, 1200, 1300]
+    assert parsers.parse_motor(b"").data["motors"] == []
+
+
 def test_voltage_meters_valid():
     payload = load_hex("voltage_ok.hex")
     result = parsers.parse_voltage_meters(payload)
@@ -50,6 +67,7 @@ def test_voltage_meters_invalid():
     payload = load_hex("voltage_invalid.hex")
     result = parsers.parse_voltage_meters(payload)
     assert result.invalid
+    assert result.data["meters"] == [{"id": 0, "value_raw": 0xFF00, "unit": "auto"}]
 
 
 def test_current_meters_valid():
@@ -65,3 +83,25 @@ def test_battery_state():
     assert not result.invalid
     assert result.data["voltage_V"] == 16.8
     assert result.data["amps_A"] == 2.5
+
+
+def test_build_info_fields():
+    payload = b"Jan 15 202412:34:56abc1234"
+    result = parsers.parse_build_info(payload)
+    assert result.data["build_date"] == "Jan 15 2024"
+    assert result.data["build_time"] == "12:34:56"
+    assert result.data["git_revision"] == "abc1234"
+    assert result.data["value"] == "Jan 15 2024 12:34:56 abc1234"
+
+
+def test_board_info_fields():
+    result = parsers.parse_board_info(b"S7X2\x02\x00\x00")
+    assert result.data["value"] == "S7X2"
+    assert result.data["hw_revision"] == 2
+
+
+def test_raw_hex_is_rendered_from_payload():
+    payload = load_hex("status.hex")
+    result = parsers.parse_status(payload)
+    assert result.payload is payload
+    assert result.raw_hex == payload.hex()
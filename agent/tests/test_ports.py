@@ -4,6 +4,7 @@ from types import SimpleNamespace
 
 import pytest
 
+from multi_inst_agent.io import ports as ports_module
 from multi_inst_agent.io.ports import PortFilterConfig, list_port_strings
 
 
@@ -28,6 +29,7 @@ def reset_list_ports(monkeypatch):
         return called["ports"]
 
     monkeypatch.setattr("serial.tools.list_ports.comports", fake_comports)
+    monkeypatch.setattr(ports_module, "_comports_cache", None)
     called["ports"] = []
     return called
 
@@ -66,3 +68,12 @@ def test_includes_simulated_when_requested(reset_list_ports):
     config = PortFilterConfig(include_simulated=True, enforce_whitelist=False)
     ports = list_port_strings(config)
     assert ports == ["/dev/ttyACM3", "sim://001"]
+
+
+def test_enumeration_is_shared_within_ttl(reset_list_ports, monkeypatch):
+    reset_list_ports["ports"] = [_make_port("/dev/ttyACM0", vid=0x0483, pid=0x5740)]
+    assert list_port_strings() == ["/dev/ttyACM0"]
+    reset_list_ports["ports"] = []
+    assert list_port_strings() == ["/dev/ttyACM0"]
+    monkeypatch.setattr(ports_module, "_COMPORTS_TTL", 0.0)
+    assert list_port_strings() == []
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from itertools import islice
+
+from multi_inst_agent.core import runtime
+from multi_inst_agent.core.msp import build_frame_v1
+from multi_inst_agent.core.parsers import MSP_COMMANDS, parse_payload
+from multi_inst_agent.core.runtime import (
+    MSP_POLL_COMMANDS,
+    DeviceContext,
+    EventQueue,
+    Session,
+    _sim_noise,
+    _sleep_until_next_slot,
+)
+from multi_inst_agent.io.json_writer import ReportWriter
+
+
+def _reply(cmd: int, payload: bytes = b"") -> bytes:
+    checksum = len(payload) ^ cmd
+    for byte in payload:
+        checksum ^= byte
+    return b"$M>" + bytes([len(payload), cmd]) + payload + bytes([checksum])
+
+
+class StaleSerial:
+    """Serial port still holding a late reply when the tick's burst goes out."""
+
+    def __init__(self, stale: bytes, reply: bytes) -> None:
+        self.buffer = bytearray(stale)
+        self.reply = reply
+        self.written = bytearray()
+
+    def reset_input_buffer(self) -> None:
+        self.buffer.clear()
+
+    def write(self, data: bytes) -> int:
+        self.written.extend(data)
+        self.buffer.extend(self.reply)
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        chunk = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return chunk
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_slots_are_fixed_rate_and_reanchor_after_overrun():
+    start = time.monotonic()
+    slot = asyncio.run(_sleep_until_next_slot(start, 0.01))
+    assert slot == start + 0.01
+    assert time.monotonic() >= slot
+
+    stale = time.monotonic() - 1.0
+    slot = asyncio.run(_sleep_until_next_slot(stale, 0.01))
+    assert slot > stale + 0.5
+
+
+def test_event_queue_coalesces_snapshots_without_reordering():
+    async def drain(queue):
+        return [await queue.get() for _ in range(queue.qsize())]
+
+    queue = EventQueue()
+    queue.put_nowait({"type": "snapshot", "uid": "A", "n": 1})
+    queue.put_nowait({"type": "snapshot", "uid": "B", "n": 1})
+    queue.put_nowait({"type": "snapshot", "uid": "A", "n": 2})
+    queue.put_nowait({"type": "removed", "uid": "A"})
+    queue.put_nowait({"type": "snapshot", "uid": "A", "n": 3})
+    events = asyncio.run(drain(queue))
+    assert [(e["type"], e["uid"], e.get("n")) for e in events] == [
+        ("snapshot", "A", 2),
+        ("snapshot", "B", 1),
+        ("removed", "A", None),
+        ("snapshot", "A", 3),
+    ]
+
+
+def test_event_queue_drops_oldest_past_maxsize():
+    queue = EventQueue(maxsize=2)
+    for idx in range(3):
+        queue.put_nowait({"type": "probe_failed", "port": str(idx)})
+    assert queue.qsize() == 2
+    assert asyncio.run(queue.get())["port"] == "1"
+
+
+def test_payload_dispatch_updates_snapshot_and_history():
+    session = Session.__new__(Session)
+    ctx = DeviceContext("FC-1", "/dev/ttyACM0", "usb_stand", "basic", False, False)
+    status = bytes.fromhex("fa00000023000000010000000000")
+    meters = bytes.fromhex("01003200")
+    for cmd, payload in (
+        (MSP_COMMANDS["MSP_STATUS"], status),
+        (MSP_COMMANDS["MSP_VOLTAGE_METERS"], meters),
+    ):
+        session._update_from_payload(ctx, cmd, parse_payload(cmd, payload), 1.0)
+    assert ctx.snapshot["status"]["cycleTime_us"] == 250
+    assert list(ctx.history_cycle) == [250.0]
+    assert ctx.snapshot["voltage_meters"]["meters"][0]["voltage_V"] == 5.0
+
+
+def test_sim_noise_is_per_port_deterministic_across_blocks():
+    first = list(islice(_sim_noise("/dev/sim0"), 100))
+    again = list(islice(_sim_noise("/dev/sim0"), 100))
+    assert first == again
+    assert all(len(row) == 11 and 0.0 <= row[-1] < 360.0 for row in first)
+    assert first[0] != next(_sim_noise("/dev/sim1"))
+
+
+def test_serial_tick_ignores_reply_left_from_previous_tick(tmp_path, monkeypatch):
+    status_cmd = MSP_COMMANDS["MSP_STATUS"]
+    stale = _reply(status_cmd, bytes.fromhex("e7030000230000000100000000"))
+    status = bytes.fromhex("fa00000023000000010000000000")
+    reply = b"".join(
+        _reply(cmd, status if cmd == status_cmd else b"") for cmd in MSP_POLL_COMMANDS
+    )
+    ser = StaleSerial(stale, reply)
+    monkeypatch.setattr(runtime, "open_serial_port", lambda *args: ser)
+
+    session = Session.__new__(Session)
+    session.running = True
+    session.baud = 115200
+    session.test_duration = 0.05
+    session.snapshots = {}
+    session.completed_reports = {}
+    session.manager = None
+    session.queue = EventQueue()
+    session.report_writer = ReportWriter(str(tmp_path))
+    ctx = DeviceContext("FC-1", "/dev/ttyACM0", "usb_stand", "basic", False, False)
+    asyncio.run(session._run_serial(ctx))
+
+    assert bytes(ser.written) == b"".join(map(build_frame_v1, MSP_POLL_COMMANDS))
+    assert "errors" not in ctx.snapshot
+    assert list(ctx.history_cycle) == [250.0]
+    packets = [p for p in ctx.raw_packets if p["cmd"] == status_cmd]
+    assert [p["payload_hex"] for p in packets] == [status.hex()]
@@ -1,6 +1,24 @@
 import { useEffect, useRef } from "react";
 import * as echarts from "echarts";
 
+const BINS = 15;
+
+function binValues(values: number[]) {
+  // One pass for the range and one for the counts; no argument spreading.
+  let min = values[0];
+  let max = values[0];
+  for (const value of values) {
+    if (value < min) min = value;
+    else if (value > max) max = value;
+  }
+  const step = (max - min) / BINS || 1;
+  const histogram = new Array<number>(BINS).fill(0);
+  for (const value of values) {
+    histogram[Math.min(BINS - 1, Math.floor((value - min) / step))] += 1;
+  }
+  return { min, step, histogram };
+}
+
 type Props = {
   title: string;
   data: number[];
@@ -9,20 +27,27 @@ type Props = {
 
 export default function Histogram({ title, data, color = "#f97316" }: Props) {
   const ref = useRef<HTMLDivElement>(null);
+  const chartRef = useRef<echarts.ECharts | null>(null);
+
   useEffect(() => {
     if (!ref.current) return;
     const chart = echarts.init(ref.current, null, { renderer: "svg" });
-    const values = data.length ? data : [0];
-    const bins = 15;
-    const min = Math.min(...values);
-    const max = Math.max(...values);
-    const step = bins > 0 ? (max - min) / bins || 1 : 1;
-    const histogram = new Array(bins).fill(0);
-    values.forEach((value) => {
-      const idx = Math.min(bins - 1, Math.max(0, Math.floor((value - min) / step)));
-      histogram[idx] += 1;
-    });
+    chartRef.current = chart;
+    const handle = () => chart.resize();
+    window.addEventListener("resize", handle);
+    return () => {
+      window.removeEventListener("resize", handle);
+      chartRef.current = null;
+      chart.dispose();
+    };
+  }, []);
+
+  useEffect(() => {
+    const chart = chartRef.current;
+    if (!chart) return;
+    const { min, step, histogram } = binValues(data.length ? data : [0]);
     chart.setOption({
+      animation: false,
       title: { text: title, textStyle: { color: "#cbd5f5", fontSize: 12 } },
       grid: { left: 32, right: 8, top: 24, bottom: 24 },
       xAxis: {
@@ -39,12 +64,6 @@ export default function Histogram({ title, data, color = "#f97316" }: Props) {
         }
       ]
     });
-    const handle = () => chart.resize();
-    window.addEventListener("resize", handle);
-    return () => {
-      window.removeEventListener("resize", handle);
-      chart.dispose();
-    };
   }, [title, data, color]);
 
   return <div ref={ref} className="h-48 w-full" />;
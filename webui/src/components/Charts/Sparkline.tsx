@@ -1,5 +1,6 @@
 import { useEffect, useRef } from "react";
 import * as echarts from "echarts";
+import { indexAxis } from "./axis";
 
 type Props = {
   data: number[];
@@ -8,17 +9,34 @@ type Props = {
 
 export default function Sparkline({ data, color }: Props) {
   const ref = useRef<HTMLDivElement>(null);
+  const chartRef = useRef<echarts.ECharts | null>(null);
 
+  // One chart per mounted sparkline; telemetry ticks only push new data.
   useEffect(() => {
     if (!ref.current) return;
     const chart = echarts.init(ref.current, null, { renderer: "svg" });
-    chart.setOption({
+    chartRef.current = chart;
+    const handle = () => {
+      chart.resize();
+    };
+    window.addEventListener("resize", handle);
+    return () => {
+      window.removeEventListener("resize", handle);
+      chartRef.current = null;
+      chart.dispose();
+    };
+  }, []);
+
+  useEffect(() => {
+    chartRef.current?.setOption({
+      animation: false,
       grid: { left: 0, right: 0, top: 0, bottom: 0 },
-      xAxis: { type: "category", show: false, data: data.map((_, idx) => idx) },
+      xAxis: { type: "category", show: false, data: indexAxis(data.length) },
       yAxis: { type: "value", show: false },
       series: [
         {
           type: "line",
+          sampling: "lttb",
           data: data.length ? data : [0],
           smooth: true,
           areaStyle: { opacity: 0.2 },
@@ -28,14 +46,6 @@ export default function Sparkline({ data, color }: Props) {
         }
       ]
     });
-    const handle = () => {
-      chart.resize();
-    };
-    window.addEventListener("resize", handle);
-    return () => {
-      window.removeEventListener("resize", handle);
-      chart.dispose();
-    };
   }, [data, color]);
 
   return <div ref={ref} className="h-16 w-full" />;
@@ -1,5 +1,6 @@
 import { useEffect, useRef } from "react";
 import * as echarts from "echarts";
+import { indexAxis } from "./axis";
 
 type Props = {
   title: string;
@@ -9,18 +10,34 @@ type Props = {
 
 export default function TimeSeries({ title, data, color = "#38bdf8" }: Props) {
   const ref = useRef<HTMLDivElement>(null);
+  const chartRef = useRef<echarts.ECharts | null>(null);
 
   useEffect(() => {
     if (!ref.current) return;
     const chart = echarts.init(ref.current, null, { renderer: "svg" });
+    chartRef.current = chart;
+    const handle = () => chart.resize();
+    window.addEventListener("resize", handle);
+    return () => {
+      window.removeEventListener("resize", handle);
+      chartRef.current = null;
+      chart.dispose();
+    };
+  }, []);
+
+  useEffect(() => {
+    const chart = chartRef.current;
+    if (!chart) return;
     chart.setOption({
+      animation: false,
       title: { text: title, textStyle: { color: "#cbd5f5", fontSize: 12 } },
       grid: { left: 32, right: 8, top: 24, bottom: 24 },
-      xAxis: { type: "category", boundaryGap: false, show: false, data: data.map((_, idx) => idx) },
+      xAxis: { type: "category", boundaryGap: false, show: false, data: indexAxis(data.length) },
       yAxis: { type: "value", axisLine: { lineStyle: { color: "#475569" } }, splitLine: { show: false } },
       series: [
         {
           type: "line",
+          sampling: "lttb",
           data: data.length ? data : [0],
           smooth: true,
           showSymbol: false,
@@ -29,12 +46,6 @@ export default function TimeSeries({ title, data, color = "#38bdf8" }: Props) {
         }
       ]
     });
-    const handle = () => chart.resize();
-    window.addEventListener("resize", handle);
-    return () => {
-      window.removeEventListener("resize", handle);
-      chart.dispose();
-    };
   }, [title, data, color]);
 
   return <div ref={ref} className="h-48 w-full" />;
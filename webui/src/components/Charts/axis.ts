@@ -0,0 +1,12 @@
+const INDEX_AXES = new Map<number, number[]>();
+
+// Category labels 0..length-1 for the hidden x axes. History windows are a
+// handful of fixed lengths, so each array is built once and shared.
+export function indexAxis(length: number): number[] {
+  let axis = INDEX_AXES.get(length);
+  if (!axis) {
+    axis = Array.from({ length }, (_, idx) => idx);
+    INDEX_AXES.set(length, axis);
+  }
+  return axis;
+}
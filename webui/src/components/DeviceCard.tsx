@@ -1,3 +1,4 @@
+import { memo } from "react";
 import { Link } from "react-router-dom";
 import { DeviceSnapshot } from "../lib/api";
 import { useAppStore } from "../store/useAppStore";
@@ -15,7 +16,9 @@ const STATUS_CLASS = {
   testing: "bg-amber-500/15 text-amber-300 border border-amber-400/40",
 };
 
-export default function DeviceCard({ device, mode, profile }: Props) {
+// Memoised: the store keeps unchanged devices' snapshot objects, so a tick
+// for one device re-renders only that device's card.
+export default memo(function DeviceCard({ device, mode, profile }: Props) {
   const retest = useAppStore((state) => state.retest);
   const status = deriveStatus(device);
   const loopHz = device.loop?.loop_hz ?? 0;
@@ -68,7 +71,7 @@ export default function DeviceCard({ device, mode, profile }: Props) {
       )}
     </div>
   );
-}
+});
 
 type NormalProps = {
   device: DeviceSnapshot;
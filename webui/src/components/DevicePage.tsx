@@ -1,4 +1,4 @@
-import { useMemo, useState } from "react";
+import { memo, useMemo, useState } from "react";
 import { Link, useParams } from "react-router-dom";
 import TimeSeries from "./Charts/TimeSeries";
 import Histogram from "./Charts/Histogram";
@@ -31,9 +31,10 @@ const PROFILE_LIMITS = {
 export default function DevicePage() {
   const { uid } = useParams<{ uid: string }>();
   const [tab, setTab] = useState<(typeof TABS)[number]>("overview");
-  const devices = useAppStore((state) => state.devices);
+  // Subscribe to this device only: other devices' snapshots must not
+  // re-render the detail view.
+  const device = useAppStore((state) => (uid ? state.devices[uid] : undefined));
   const profile = useAppStore((state) => state.profile);
-  const device = uid ? devices[uid] : undefined;
 
   if (!device) {
     return (
@@ -218,12 +219,13 @@ export default function DevicePage() {
               </thead>
               <tbody>
                 {filteredPackets.map((pkt) => (
-                  <tr key={`${pkt.ts}-${pkt.cmd}-${pkt.len}`} className="border-t border-border/40">
-                    <td className="px-2 py-1">{new Date(pkt.ts * 1000).toLocaleTimeString()}</td>
-                    <td className="px-2 py-1">{pkt.cmd}</td>
-                    <td className="px-2 py-1">{pkt.len}</td>
-                    <td className="px-2 py-1 font-mono text-xs break-all">{pkt.payload_hex}</td>
-                  </tr>
+                  <PacketRow
+                    key={`${pkt.ts}-${pkt.cmd}-${pkt.len}`}
+                    ts={pkt.ts}
+                    cmd={pkt.cmd}
+                    len={pkt.len}
+                    payloadHex={pkt.payload_hex}
+                  />
                 ))}
               </tbody>
             </table>
@@ -234,6 +236,29 @@ export default function DevicePage() {
   );
 }
 
+// Packets are immutable once captured; with primitive props, rows that are
+// still in the window skip re-rendering (and toLocaleTimeString) per snapshot.
+const PacketRow = memo(function PacketRow({
+  ts,
+  cmd,
+  len,
+  payloadHex,
+}: {
+  ts: number;
+  cmd: number;
+  len: number;
+  payloadHex: string;
+}) {
+  return (
+    <tr className="border-t border-border/40">
+      <td className="px-2 py-1">{new Date(ts * 1000).toLocaleTimeString()}</td>
+      <td className="px-2 py-1">{cmd}</td>
+      <td className="px-2 py-1">{len}</td>
+      <td className="px-2 py-1 font-mono text-xs break-all">{payloadHex}</td>
+    </tr>
+  );
+});
+
 function MetricCard({ title, value, subtitle }: { title: string; value: string; subtitle?: string }) {
   return (
     <div className="card space-y-1">
@@ -50,11 +50,27 @@ interface AppState {
 
 let ws: WebSocket | null = null;
 
+// Snapshots arriving within one animation frame are merged into a single
+// store update: N devices cost one render per frame instead of N.
+let pendingSnapshots: DeviceMap = {};
+let pendingFrames = 0;
+let flushHandle: number | null = null;
+
+function dropPendingSnapshots() {
+  if (flushHandle !== null) {
+    cancelAnimationFrame(flushHandle);
+    flushHandle = null;
+  }
+  pendingSnapshots = {};
+  pendingFrames = 0;
+}
+
 function closeWebSocket() {
   if (ws) {
     ws.close();
     ws = null;
   }
+  dropPendingSnapshots();
 }
 
 export const useAppStore = create<AppState>((set, get) => ({
@@ -172,23 +188,34 @@ export const useAppStore = create<AppState>((set, get) => ({
     await retestDevice(sessionId, uid);
   },
   handleEvent: (event: any) => {
-    const { devices, frames, lastFrameTs } = get();
     if (event.type === "snapshot") {
-      const uid = event.uid as string;
-      const nextDevices: DeviceMap = { ...devices, [uid]: event.data };
-      let newFrames = frames + 1;
-      let lastTs = lastFrameTs || Date.now();
-      let fps = get().fps;
-      const now = Date.now();
-      if (now - lastTs >= 1000) {
-        fps = Math.round((newFrames * 1000) / (now - lastTs));
-        newFrames = 0;
-        lastTs = now;
-      }
-      set({ devices: nextDevices, frames: newFrames, lastFrameTs: lastTs, fps });
+      pendingSnapshots[event.uid as string] = event.data;
+      pendingFrames += 1;
+      if (flushHandle !== null) return;
+      flushHandle = requestAnimationFrame(() => {
+        flushHandle = null;
+        const batch = pendingSnapshots;
+        const received = pendingFrames;
+        pendingSnapshots = {};
+        pendingFrames = 0;
+        const { devices, frames, lastFrameTs } = get();
+        const nextDevices: DeviceMap = { ...devices, ...batch };
+        let newFrames = frames + received;
+        let lastTs = lastFrameTs || Date.now();
+        let fps = get().fps;
+        const now = Date.now();
+        if (now - lastTs >= 1000) {
+          fps = Math.round((newFrames * 1000) / (now - lastTs));
+          newFrames = 0;
+          lastTs = now;
+        }
+        set({ devices: nextDevices, frames: newFrames, lastFrameTs: lastTs, fps });
+      });
     } else if (event.type === "removed") {
-      const nextDevices: DeviceMap = { ...devices };
-      delete nextDevices[event.uid as string];
+      const uid = event.uid as string;
+      delete pendingSnapshots[uid];
+      const nextDevices: DeviceMap = { ...get().devices };
+      delete nextDevices[uid];
       set({ devices: nextDevices });
     } else if (event.type === "probe_failed") {
       set({ error: event.reason });